@@ -27,6 +27,7 @@ Notes:
   - Notable exceptions include *union types* thereof, which do not have the necessary fields/ methods. 
 """
 
+import sys
 from typing import TypeVar, Type, Optional
 from pydantic import __version__ as _pydantic_version
 
@@ -72,6 +73,11 @@ else:  # _pydantic_major_version==2
 
 from pydantic.dataclasses import dataclass
 
+# Keyword arguments enabling `__slots__` on dataclasses, where supported.
+# Standard-library dataclasses support `slots` from Python 3.10, and pydantic dataclasses from pydantic 2.x.
+STDLIB_SLOTS = dict(slots=True) if sys.version_info >= (3, 10) else dict()
+PYDANTIC_SLOTS = STDLIB_SLOTS if PYDANTIC_V2 else dict()
+
 T = TypeVar("T")
 datatypes = []  # The list of defined datatypes
 
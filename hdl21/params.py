@@ -11,7 +11,7 @@ import pydantic
 
 # Local Imports
 from .default import Default
-from .datatype import AllowArbConfig, pydantic_json_encoder
+from .datatype import AllowArbConfig, PYDANTIC_SLOTS, pydantic_json_encoder
 
 T = TypeVar("T")
 
@@ -119,7 +119,9 @@ def paramclass(cls: Type[T]) -> Type[T]:
     cls.defaults = classmethod(defaults)
 
     # Pass this through the pydantic dataclass-decorator-function
-    cls = pydantic.dataclasses.dataclass(cls, config=AllowArbConfig, frozen=True)
+    cls = pydantic.dataclasses.dataclass(
+        cls, config=AllowArbConfig, frozen=True, **PYDANTIC_SLOTS
+    )
 
     # Pydantic seems to want to add this one *after* class-creation
     def _brick_subclassing_(cls, *_, **__):
@@ -60,15 +60,12 @@ Summary of the content of the primitive library:
 # On changes to this module, re-run the script, paste the table here and anywhere else it is used.
 
 # Std-Lib Imports
-import copy
 from enum import Enum
-from dataclasses import replace
+from dataclasses import dataclass, replace
 from typing import Optional, Any, List, Type, Dict
 
-# PyPi Imports
-from pydantic.dataclasses import dataclass
-
 # Local imports
+from .datatype import STDLIB_SLOTS
 from .default import Default
 from .call import param_call
 from .params import paramclass, Param, isparamclass, NoParams, _unique_name
@@ -84,8 +81,17 @@ class PrimitiveType(Enum):
     PHYSICAL = "PHYSICAL"
 
 
-@dataclass
-class Primitive:
+class _PrimitiveCache:
+    """# Primitive Cache
+    Base class holding `Primitive`'s internal, derived data.
+    Stored in a slot here, rather than as a dataclass field, so it stays out of `dataclasses.fields` and `asdict`."""
+
+    # Name-to-port dictionary, set during `Primitive.__post_init__`
+    __slots__ = ("_ports",)
+
+
+@dataclass(frozen=True, **STDLIB_SLOTS)
+class Primitive(_PrimitiveCache):
     """# Hdl21 Primitive Component
 
     Primitives are leaf-level Modules typically defined not by users,
@@ -100,16 +106,21 @@ class Primitive:
     primtype: PrimitiveType  # Ideal vs Physical Primitive-Type
 
     def __post_init__(self):
-        """After type-checking, do plenty more checks on values"""
+        """Post-Constructor Checks"""
         if not isparamclass(self.paramtype):
             msg = f"Invalid Primitive param-type {self.paramtype} for {self.name}, must be an `hdl21.paramclass`"
             raise TypeError(msg)
+        if not isinstance(self.primtype, PrimitiveType):
+            msg = f"Invalid Primitive primtype {self.primtype} for {self.name}, must be a `PrimitiveType`"
+            raise TypeError(msg)
         for p in self.port_list:
             if not p.name:
                 raise ValueError(f"Unnamed Primitive Port {p} for {self.name}")
             if p.vis != Visibility.PORT:
                 msg = f"Invalid Primitive Port {p.name} on {self.name}; must have PORT visibility"
                 raise ValueError(msg)
+        # Port-lists are fixed after construction; build the name-to-port dictionary once.
+        object.__setattr__(self, "_ports", {p.name: p for p in self.port_list})
 
     def __call__(self, arg: Any = Default, **kwargs) -> "PrimitiveCall":
         params = param_call(callee=self, arg=arg, **kwargs)
@@ -122,7 +133,12 @@ class Primitive:
 
     @property
     def ports(self) -> Dict[str, Signal]:
-        return {p.name: p for p in self.port_list}
+        return self._ports
+
+    def __reduce__(self):
+        # Copy and pickle through the constructor, so that `__post_init__` re-creates the cached port dictionary.
+        args = (self.name, self.desc, self.port_list, self.paramtype, self.primtype)
+        return (Primitive, args)
 
     def __eq__(self, other) -> bool:
         # Identity is equality
@@ -134,7 +150,7 @@ class Primitive:
 
 
 @calls_instantiate
-@dataclass
+@dataclass(frozen=True, **STDLIB_SLOTS)
 class PrimitiveCall:
     """Primitive Call
     A combination of a Primitive and its Parameter-values,
@@ -144,8 +160,9 @@ class PrimitiveCall:
     params: Any = NoParams
 
     def __post_init__(self):
-        # Type-validate our parameters
-        if not isinstance(self.params, self.prim.paramtype):
+        # Type-validate our parameters.
+        # Param-classes cannot be sub-classed, so an exact type-match is all we need here.
+        if type(self.params) is not self.prim.paramtype:
             msg = f"Invalid parameters {self.params} for Primitive {self.prim}. Must be {self.prim.paramtype}"
             raise TypeError(msg)
 
@@ -154,8 +171,8 @@ class PrimitiveCall:
         return self.prim.name + "(" + _unique_name(self.params) + ")"
 
     @property
-    def ports(self) -> dict:
-        return self.prim.ports
+    def ports(self) -> Dict[str, Signal]:
+        return self.prim._ports
 
     def __eq__(self, other) -> bool:
         """Call equality requires:
@@ -268,6 +285,9 @@ class MosParams:
     #         raise ValueError(msg)
 
 
+# Note the port-lists defined in this module are each created once at import-time.
+# Their `Signal`s are shared among each `Primitive` that uses them; each gets its own (shallow) copy of the list.
+
 # Mos Transistor Ports, in SPICE Conventional Order
 MosPorts = [
     Port(name="d", desc="Drain"),
@@ -280,7 +300,7 @@ Mos = _add(
     prim=Primitive(
         name="Mos",
         desc="Mos Transistor",
-        port_list=copy.deepcopy(MosPorts),
+        port_list=list(MosPorts),
         paramtype=MosParams,
         primtype=PrimitiveType.PHYSICAL,
     ),
@@ -290,16 +310,14 @@ Mos = _add(
 
 def Nmos(arg: Any = Default, **kwargs) -> Primitive:
     """Nmos Constructor. A thin wrapper around `hdl21.primitives.Mos`"""
-    mos = Mos(arg, **kwargs)
-    mos.params = replace(mos.params, tp=MosType.NMOS)
-    return mos
+    params = param_call(callee=Mos, arg=arg, **kwargs)
+    return Mos(replace(params, tp=MosType.NMOS))
 
 
 def Pmos(arg: Any = Default, **kwargs) -> Primitive:
     """Pmos Constructor. A thin wrapper around `hdl21.primitives.Mos`"""
-    mos = Mos(arg, **kwargs)
-    mos.params = replace(mos.params, tp=MosType.PMOS)
-    return mos
+    params = param_call(callee=Mos, arg=arg, **kwargs)
+    return Mos(replace(params, tp=MosType.PMOS))
 
 
 """ 
@@ -308,8 +326,22 @@ Passives
 
 # Oft-reused port list for the passive elements
 PassivePorts = [Port(name="p"), Port(name="n")]
-# And the three-terminal version
-ThreeTerminalPorts = [Port(name="p"), Port(name="n"), Port(name="b")]
+# And the three-terminal version, sharing the same `p` and `n` ports
+ThreeTerminalPorts = PassivePorts + [Port(name="b")]
+
+
+def _two_terminal(
+    name: str, desc: str, paramtype: Type, primtype: PrimitiveType, aliases: List[str]
+) -> Primitive:
+    """Create and add a two-terminal Primitive, with ports `p` and `n` shared via `PassivePorts`."""
+    prim = Primitive(
+        name=name,
+        desc=desc,
+        port_list=list(PassivePorts),
+        paramtype=paramtype,
+        primtype=primtype,
+    )
+    return _add(prim=prim, aliases=aliases)
 
 
 @paramclass
@@ -317,14 +349,11 @@ class ResistorParams:
     r = Param(dtype=Scalar, desc="Resistance (ohms)")
 
 
-IdealResistor = _add(
-    prim=Primitive(
-        name="IdealResistor",
-        desc="Ideal Resistor",
-        port_list=copy.deepcopy(PassivePorts),
-        paramtype=ResistorParams,
-        primtype=PrimitiveType.IDEAL,
-    ),
+IdealResistor = _two_terminal(
+    name="IdealResistor",
+    desc="Ideal Resistor",
+    paramtype=ResistorParams,
+    primtype=PrimitiveType.IDEAL,
     aliases=["R", "Res", "Resistor", "IdealR", "IdealRes"],
 )
 
@@ -336,14 +365,11 @@ class PhysicalResistorParams:
     model = Param(dtype=Optional[str], desc="Model (Name)", default=None)
 
 
-PhysicalResistor = _add(
-    prim=Primitive(
-        name="PhysicalResistor",
-        desc="Physical Resistor",
-        port_list=copy.deepcopy(PassivePorts),
-        paramtype=PhysicalResistorParams,
-        primtype=PrimitiveType.PHYSICAL,
-    ),
+PhysicalResistor = _two_terminal(
+    name="PhysicalResistor",
+    desc="Physical Resistor",
+    paramtype=PhysicalResistorParams,
+    primtype=PrimitiveType.PHYSICAL,
     aliases=["PhyR", "PhyRes", "ResPhy", "PhyResistor"],
 )
 
@@ -352,7 +378,7 @@ ThreeTerminalResistor = _add(
     prim=Primitive(
         name="ThreeTerminalResistor",
         desc="Three Terminal Resistor",
-        port_list=copy.deepcopy(ThreeTerminalPorts),
+        port_list=list(ThreeTerminalPorts),
         paramtype=PhysicalResistorParams,
         primtype=PrimitiveType.PHYSICAL,
     ),
@@ -365,14 +391,11 @@ class IdealCapacitorParams:
     c = Param(dtype=Scalar, desc="Capacitance (F)")
 
 
-IdealCapacitor = _add(
-    prim=Primitive(
-        name="IdealCapacitor",
-        desc="Ideal Capacitor",
-        port_list=copy.deepcopy(PassivePorts),
-        paramtype=IdealCapacitorParams,
-        primtype=PrimitiveType.IDEAL,
-    ),
+IdealCapacitor = _two_terminal(
+    name="IdealCapacitor",
+    desc="Ideal Capacitor",
+    paramtype=IdealCapacitorParams,
+    primtype=PrimitiveType.IDEAL,
     aliases=["C", "Cap", "Capacitor", "IdealC", "IdealCap"],
 )
 
@@ -386,14 +409,11 @@ class PhysicalCapacitorParams:
     mult = Param(dtype=Optional[str], desc="Multiplier", default=None)
 
 
-PhysicalCapacitor = _add(
-    prim=Primitive(
-        name="PhysicalCapacitor",
-        desc="Physical Capacitor",
-        port_list=copy.deepcopy(PassivePorts),
-        paramtype=PhysicalCapacitorParams,
-        primtype=PrimitiveType.PHYSICAL,
-    ),
+PhysicalCapacitor = _two_terminal(
+    name="PhysicalCapacitor",
+    desc="Physical Capacitor",
+    paramtype=PhysicalCapacitorParams,
+    primtype=PrimitiveType.PHYSICAL,
     aliases=["PhyC", "PhyCap", "CapPhy", "PhyCapacitor"],
 )
 
@@ -402,7 +422,7 @@ ThreeTerminalCapacitor = _add(
     prim=Primitive(
         name="ThreeTerminalCapacitor",
         desc="Three Terminal Capacitor",
-        port_list=copy.deepcopy(ThreeTerminalPorts),
+        port_list=list(ThreeTerminalPorts),
         paramtype=PhysicalCapacitorParams,
         primtype=PrimitiveType.PHYSICAL,
     ),
@@ -415,14 +435,11 @@ class IdealInductorParams:
     l = Param(dtype=Scalar, desc="Inductance (H)")
 
 
-IdealInductor = _add(
-    prim=Primitive(
-        name="IdealInductor",
-        desc="Ideal Inductor",
-        port_list=copy.deepcopy(PassivePorts),
-        paramtype=IdealInductorParams,
-        primtype=PrimitiveType.IDEAL,
-    ),
+IdealInductor = _two_terminal(
+    name="IdealInductor",
+    desc="Ideal Inductor",
+    paramtype=IdealInductorParams,
+    primtype=PrimitiveType.IDEAL,
     aliases=["L", "Ind", "Inductor", "IdealL", "IdealInd"],
 )
 
@@ -432,14 +449,11 @@ class PhysicalInductorParams:
     l = Param(dtype=Scalar, desc="Inductance (H)")
 
 
-PhysicalInductor = _add(
-    Primitive(
-        name="PhysicalInductor",
-        desc="Physical Inductor",
-        port_list=copy.deepcopy(PassivePorts),
-        paramtype=PhysicalInductorParams,
-        primtype=PrimitiveType.PHYSICAL,
-    ),
+PhysicalInductor = _two_terminal(
+    name="PhysicalInductor",
+    desc="Physical Inductor",
+    paramtype=PhysicalInductorParams,
+    primtype=PrimitiveType.PHYSICAL,
     aliases=["PhyL", "PhyInd", "IndPhy", "PhyInductor"],
 )
 
@@ -448,7 +462,7 @@ ThreeTerminalInductor = _add(
     prim=Primitive(
         name="ThreeTerminalInductor",
         desc="Three Terminal Inductor",
-        port_list=copy.deepcopy(ThreeTerminalPorts),
+        port_list=list(ThreeTerminalPorts),
         paramtype=PhysicalInductorParams,
         primtype=PrimitiveType.PHYSICAL,
     ),
@@ -463,14 +477,11 @@ class PhysicalShortParams:
     l = Param(dtype=Optional[Scalar], desc="Length in resolution units", default=None)
 
 
-PhysicalShort = _add(
-    prim=Primitive(
-        name="PhysicalShort",
-        desc="Short-Circuit/ Net-Tie",
-        port_list=copy.deepcopy(PassivePorts),
-        paramtype=PhysicalShortParams,
-        primtype=PrimitiveType.PHYSICAL,
-    ),
+PhysicalShort = _two_terminal(
+    name="PhysicalShort",
+    desc="Short-Circuit/ Net-Tie",
+    paramtype=PhysicalShortParams,
+    primtype=PrimitiveType.PHYSICAL,
     aliases=["Short"],
 )
 
@@ -488,19 +499,12 @@ class DcVoltageSourceParams:
     ac = Param(dtype=Optional[Scalar], default=None, desc="AC Amplitude (V)")
 
 
-DcVoltageSource = _add(
-    prim=Primitive(
-        name="DcVoltageSource",
-        desc="DC Voltage Source",
-        port_list=copy.deepcopy(PassivePorts),
-        paramtype=DcVoltageSourceParams,
-        primtype=PrimitiveType.IDEAL,
-    ),
-    aliases=[
-        "V",
-        "Vdc",
-        "Vsrc",
-    ],
+DcVoltageSource = _two_terminal(
+    name="DcVoltageSource",
+    desc="DC Voltage Source",
+    paramtype=DcVoltageSourceParams,
+    primtype=PrimitiveType.IDEAL,
+    aliases=["V", "Vdc", "Vsrc"],
 )
 
 
@@ -517,14 +521,11 @@ class PulseVoltageSourceParams:
     width = Param(dtype=Optional[Scalar], default=None, desc="Pulse width (s)")
 
 
-PulseVoltageSource = _add(
-    prim=Primitive(
-        name="PulseVoltageSource",
-        desc="Pulse Voltage Source",
-        port_list=copy.deepcopy(PassivePorts),
-        paramtype=PulseVoltageSourceParams,
-        primtype=PrimitiveType.IDEAL,
-    ),
+PulseVoltageSource = _two_terminal(
+    name="PulseVoltageSource",
+    desc="Pulse Voltage Source",
+    paramtype=PulseVoltageSourceParams,
+    primtype=PrimitiveType.IDEAL,
     aliases=["Vpu", "Vpulse"],
 )
 
@@ -543,14 +544,11 @@ class SineVoltageSourceParams:
     phase = Param(dtype=Optional[Scalar], default=None, desc="Phase at td (degrees)")
 
 
-SineVoltageSource = _add(
-    prim=Primitive(
-        name="SineVoltageSource",
-        desc="Sine Voltage Source",
-        port_list=copy.deepcopy(PassivePorts),
-        paramtype=SineVoltageSourceParams,
-        primtype=PrimitiveType.IDEAL,
-    ),
+SineVoltageSource = _two_terminal(
+    name="SineVoltageSource",
+    desc="Sine Voltage Source",
+    paramtype=SineVoltageSourceParams,
+    primtype=PrimitiveType.IDEAL,
     aliases=["Vsin"],
 )
 
@@ -560,14 +558,11 @@ class CurrentSourceParams:
     dc = Param(dtype=Optional[Scalar], default=0, desc="DC Value (A)")
 
 
-CurrentSource = _add(
-    Primitive(
-        name="CurrentSource",
-        desc="Ideal DC Current Source",
-        port_list=copy.deepcopy(PassivePorts),
-        paramtype=CurrentSourceParams,
-        primtype=PrimitiveType.IDEAL,
-    ),
+CurrentSource = _two_terminal(
+    name="CurrentSource",
+    desc="Ideal DC Current Source",
+    paramtype=CurrentSourceParams,
+    primtype=PrimitiveType.IDEAL,
     aliases=["I", "Idc", "Isrc"],
 )
 
@@ -594,7 +589,7 @@ VoltageControlledVoltageSource = _add(
     prim=Primitive(
         name="VoltageControlledVoltageSource",
         desc="Voltage Controlled Voltage Source",
-        port_list=copy.deepcopy(ControlledSourcePorts),
+        port_list=list(ControlledSourcePorts),
         paramtype=ControlledSourceParams,
         primtype=PrimitiveType.IDEAL,
     ),
@@ -604,7 +599,7 @@ CurrentControlledVoltageSource = _add(
     prim=Primitive(
         name="CurrentControlledVoltageSource",
         desc="Current Controlled Voltage Source",
-        port_list=copy.deepcopy(ControlledSourcePorts),
+        port_list=list(ControlledSourcePorts),
         paramtype=ControlledSourceParams,
         primtype=PrimitiveType.IDEAL,
     ),
@@ -614,7 +609,7 @@ VoltageControlledCurrentSource = _add(
     prim=Primitive(
         name="VoltageControlledCurrentSource",
         desc="Voltage Controlled Current Source",
-        port_list=copy.deepcopy(ControlledSourcePorts),
+        port_list=list(ControlledSourcePorts),
         paramtype=ControlledSourceParams,
         primtype=PrimitiveType.IDEAL,
     ),
@@ -624,7 +619,7 @@ CurrentControlledCurrentSource = _add(
     prim=Primitive(
         name="CurrentControlledCurrentSource",
         desc="Current Controlled Current Source",
-        port_list=copy.deepcopy(ControlledSourcePorts),
+        port_list=list(ControlledSourcePorts),
         paramtype=ControlledSourceParams,
         primtype=PrimitiveType.IDEAL,
     ),
@@ -669,7 +664,7 @@ Bipolar = _add(
     prim=Primitive(
         name="Bipolar",
         desc="Bipolar Transistor",
-        port_list=copy.deepcopy(BipolarPorts),
+        port_list=list(BipolarPorts),
         paramtype=BipolarParams,
         primtype=PrimitiveType.PHYSICAL,
     ),
@@ -679,16 +674,14 @@ Bipolar = _add(
 
 def Npn(arg: Any = Default, **kwargs) -> Primitive:
     """Npn Constructor. A thin wrapper around `hdl21.primitives.Bipolar`"""
-    bip = Bipolar(arg, **kwargs)
-    bip.params = replace(bip.params, tp=BipolarType.NPN)
-    return bip
+    params = param_call(callee=Bipolar, arg=arg, **kwargs)
+    return Bipolar(replace(params, tp=BipolarType.NPN))
 
 
 def Pnp(arg: Any = Default, **kwargs) -> Primitive:
     """Pnp Constructor. A thin wrapper around `hdl21.primitives.Bipolar`"""
-    bip = Bipolar(arg, **kwargs)
-    bip.params = replace(bip.params, tp=BipolarType.PNP)
-    return bip
+    params = param_call(callee=Bipolar, arg=arg, **kwargs)
+    return Bipolar(replace(params, tp=BipolarType.PNP))
 
 
 """ 
@@ -703,14 +696,11 @@ class DiodeParams:
     model = Param(dtype=Optional[str], desc="Model (Name)", default=None)
 
 
-Diode = _add(
-    prim=Primitive(
-        name="Diode",
-        desc="Diode",
-        # Despite not really being "passive", Diode does use the same `PassivePorts` list.
-        port_list=copy.deepcopy(PassivePorts),
-        paramtype=DiodeParams,
-        primtype=PrimitiveType.PHYSICAL,
-    ),
+# Despite not really being "passive", Diode does use the same `PassivePorts` list.
+Diode = _two_terminal(
+    name="Diode",
+    desc="Diode",
+    paramtype=DiodeParams,
+    primtype=PrimitiveType.PHYSICAL,
     aliases=["D"],
 )
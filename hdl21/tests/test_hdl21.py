@@ -310,6 +310,51 @@ def test_prim2():
     # FIXME: post-elab checks
 
 
+def test_prim_bad_params():
+    # Test calling Primitives with the wrong parameter-types
+    with pytest.raises(TypeError):
+        h.Resistor(h.Mos.Params())
+    with pytest.raises(TypeError):
+        h.Mos(h.R.Params(r=50))
+    with pytest.raises(TypeError):
+        h.primitives.PrimitiveCall(prim=h.Mos, params=dict(w=1))
+
+
+def test_bad_prim():
+    # Test creating Primitives with invalid fields
+    from hdl21.primitives import Primitive, PrimitiveType
+
+    with pytest.raises(TypeError):
+        Primitive(
+            name="Bad",
+            desc="Bad Primitive",
+            port_list=[h.Port(name="p")],
+            paramtype=h.HasNoParams,
+            primtype="bogus",
+        )
+    with pytest.raises(TypeError):
+        Primitive(
+            name="Bad",
+            desc="Bad Primitive",
+            port_list=[h.Port(name="p")],
+            paramtype=dict,
+            primtype=PrimitiveType.IDEAL,
+        )
+
+
+def test_prim_wrappers():
+    # Test that the Mos & Bipolar wrappers set their types without modifying their inputs
+    params = h.Mos.Params(w=1, l=1)
+    nmos = h.Nmos(params)
+    pmos = h.Pmos(params)
+    assert nmos.params.tp == h.MosType.NMOS
+    assert pmos.params.tp == h.MosType.PMOS
+    assert nmos.params is not params
+    assert h.Npn().params.tp == h.primitives.BipolarType.NPN
+    assert h.Pnp().params.tp == h.primitives.BipolarType.PNP
+    assert h.Bipolar().params.tp == h.primitives.BipolarType.NPN
+
+
 def test_signal_slice1():
     # Initial test of signal slicing
 